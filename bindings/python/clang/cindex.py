@@ -84,15 +84,16 @@ if sys.version_info[0] == 3:
 
         @property
         def value(self):
-            if super(c_char_p, self).value is None:
+            # Read the underlying buffer only once, this is on the path of
+            # every string returned from libclang.
+            value = super(c_char_p, self).value
+            if value is None:
                 return None
-            return super(c_char_p, self).value.decode("utf8")
+            return value.decode("utf8")
 
         @classmethod
         def from_param(cls, param):
-            if isinstance(param, str):
-                return cls(param)
-            if isinstance(param, bytes):
+            if isinstance(param, (str, bytes)):
                 return cls(param)
             if param is None:
                 # Support passing null to C functions expecting char arrays
@@ -1848,9 +1849,16 @@ class Cursor(Structure):
         Yields cursors.
         """
         yield self
-        for child in self.get_children():
-            for descendant in child.walk_preorder():
-                yield descendant
+        # Keep a stack of child iterators instead of recursing, so deep trees
+        # neither pay for nested generators nor hit the recursion limit.
+        stack = [self.get_children()]
+        while stack:
+            for child in stack[-1]:
+                yield child
+                stack.append(child.get_children())
+                break
+            else:
+                stack.pop()
 
     def get_tokens(self):
         """Obtain Token instances formulating that compose this Cursor.
@@ -206,10 +206,11 @@ def merge_ctu_extdef_maps(ctudir):
 def run_analyzer_parallel(args):
     """ Runs the analyzer against the given compilation database. """
 
+    excludes = tuple(args.excludes)
+
     def exclude(filename):
         """ Return true when any excluded directory prefix the filename. """
-        return any(re.match(r'^' + directory, filename)
-                   for directory in args.excludes)
+        return filename.startswith(excludes)
 
     consts = {
         'clang': args.clang,
@@ -298,7 +299,8 @@ def analyze_compiler_wrapper_impl(result, execution):
     """ Implements analyzer compiler wrapper functionality. """
 
     # don't run analyzer when compilation fails. or when it's not requested.
-    if result or not os.getenv('ANALYZE_BUILD_CLANG'):
+    clang = os.getenv('ANALYZE_BUILD_CLANG')
+    if result or not clang:
         return
 
     # check is it a compilation?
@@ -307,7 +309,7 @@ def analyze_compiler_wrapper_impl(result, execution):
         return
     # collect the needed parameters from environment, crash when missing
     parameters = {
-        'clang': os.getenv('ANALYZE_BUILD_CLANG'),
+        'clang': clang,
         'output_dir': os.getenv('ANALYZE_BUILD_REPORT_DIR'),
         'output_format': os.getenv('ANALYZE_BUILD_REPORT_FORMAT'),
         'output_failures': os.getenv('ANALYZE_BUILD_REPORT_FAILURES'),
@@ -320,9 +322,10 @@ def analyze_compiler_wrapper_impl(result, execution):
     }
     # call static analyzer against the compilation
     for source in compilation.files:
-        parameters.update({'file': source})
-        logging.debug('analyzer parameters %s', parameters)
-        current = run(parameters)
+        # each run consumes its parameters, so give it a fresh copy
+        current_parameters = dict(parameters, file=source)
+        logging.debug('analyzer parameters %s', current_parameters)
+        current = run(current_parameters)
         # display error message from the static analyzer
         if current is not None:
             for line in current['error_output']:
@@ -455,6 +458,14 @@ def run(opts):
         return None
 
 
+# Language to preprocessor output file extension map for failure reports.
+PREPROCESSED_EXTENSIONS = {
+    'objective-c++': '.mii',
+    'objective-c': '.mi',
+    'c++': '.ii'
+}
+
+
 @require(['clang', 'directory', 'flags', 'file', 'output_dir', 'language',
           'error_output', 'exit_code'])
 def report_failure(opts):
@@ -467,8 +478,7 @@ def report_failure(opts):
     def extension():
         """ Generate preprocessor file extension. """
 
-        mapping = {'objective-c++': '.mii', 'objective-c': '.mi', 'c++': '.ii'}
-        return mapping.get(opts['language'], '.i')
+        return PREPROCESSED_EXTENSIONS.get(opts['language'], '.i')
 
     def destination():
         """ Creates failures directory if not exits yet. """
@@ -657,16 +667,18 @@ def filter_debug_flags(opts, continuation=dispatch_ctu):
     return continuation(opts)
 
 
+# Languages the static analyzer is run against.
+ACCEPTED_LANGUAGES = frozenset({
+    'c', 'c++', 'objective-c', 'objective-c++', 'c-cpp-output',
+    'c++-cpp-output', 'objective-c-cpp-output'
+})
+
+
 @require(['language', 'compiler', 'file', 'flags'])
 def language_check(opts, continuation=filter_debug_flags):
     """ Find out the language from command line parameters or file name
     extension. The decision also influenced by the compiler invocation. """
 
-    accepted = frozenset({
-        'c', 'c++', 'objective-c', 'objective-c++', 'c-cpp-output',
-        'c++-cpp-output', 'objective-c-cpp-output'
-    })
-
     # language can be given as a parameter...
     language = opts.pop('language')
     compiler = opts.pop('compiler')
@@ -677,7 +689,7 @@ def language_check(opts, continuation=filter_debug_flags):
     if language is None:
         logging.debug('skip analysis, language not known')
         return None
-    elif language not in accepted:
+    elif language not in ACCEPTED_LANGUAGES:
         logging.debug('skip analysis, language not supported')
         return None
     else:
@@ -687,22 +699,25 @@ def language_check(opts, continuation=filter_debug_flags):
         return continuation(opts)
 
 
+# Architectures the static analyzer is not run on.
+DISABLED_ARCHITECTURES = frozenset({'ppc', 'ppc64'})
+
+
 @require(['arch_list', 'flags'])
 def arch_check(opts, continuation=language_check):
     """ Do run analyzer through one of the given architectures. """
 
-    disabled = frozenset({'ppc', 'ppc64'})
-
     received_list = opts.pop('arch_list')
     if received_list:
-        # filter out disabled architectures and -arch switches
-        filtered_list = [a for a in received_list if a not in disabled]
-        if filtered_list:
-            # There should be only one arch given (or the same multiple
-            # times). If there are multiple arch are given and are not
-            # the same, those should not change the pre-processing step.
-            # But that's the only pass we have before run the analyzer.
-            current = filtered_list.pop()
+        # There should be only one arch given (or the same multiple
+        # times). If there are multiple arch are given and are not
+        # the same, those should not change the pre-processing step.
+        # But that's the only pass we have before run the analyzer.
+        # So take the last one which is not disabled, without building
+        # the filtered list.
+        current = next((a for a in reversed(received_list)
+                        if a not in DISABLED_ARCHITECTURES), None)
+        if current is not None:
             logging.debug('analysis, on arch: %s', current)
 
             opts.update({'flags': ['-arch', current] + opts['flags']})
@@ -741,6 +756,12 @@ IGNORED_FLAGS = {
 }
 
 
+# Warning options. The ones which turn a warning on are dropped from the
+# static analyzer run, the ones which suppress a warning are kept.
+WARNING_FLAG_PATTERN = re.compile(r'^-W.+')
+NO_WARNING_FLAG_PATTERN = re.compile(r'^-Wno-.+')
+
+
 def classify_parameters(command):
     """ Prepare compiler flags (filters some and add others) and take out
     language (-x) and architecture (-arch) flags for future processing. """
@@ -752,29 +773,32 @@ def classify_parameters(command):
         'compiler': compiler_language(command)  # 'c' or 'c++'
     }
 
+    # bind the loop invariants once, the loop runs for every argument
+    flags = result['flags']
+    arch_list = result['arch_list']
     # iterate on the compile options
     args = iter(command[1:])
     for arg in args:
         # take arch flags into a separate basket
         if arg == '-arch':
-            result['arch_list'].append(next(args))
+            arch_list.append(next(args))
         # take language
         elif arg == '-x':
             result['language'] = next(args)
         # parameters which looks source file are not flags
-        elif re.match(r'^[^-].+', arg) and classify_source(arg):
+        elif not arg.startswith('-') and classify_source(arg):
             pass
         # ignore some flags
         elif arg in IGNORED_FLAGS:
-            count = IGNORED_FLAGS[arg]
-            for _ in range(count):
+            for _ in range(IGNORED_FLAGS[arg]):
                 next(args)
         # we don't care about extra warnings, but we should suppress ones
         # that we don't want to see.
-        elif re.match(r'^-W.+', arg) and not re.match(r'^-Wno-.+', arg):
+        elif WARNING_FLAG_PATTERN.match(arg) and \
+                not NO_WARNING_FLAG_PATTERN.match(arg):
             pass
         # and consider everything else as compilation flag.
         else:
-            result['flags'].append(arg)
+            flags.append(arg)
 
     return result
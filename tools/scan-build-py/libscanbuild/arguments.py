@@ -477,25 +477,27 @@ class AppendCommaSeparated(argparse.Action):
 def print_active_checkers(checkers):
     """ Print active checkers to stdout. """
 
-    for name in sorted(name for name, (_, active) in checkers.items()
-                       if active):
-        print(name)
+    names = sorted(name for name, (_, active) in checkers.items() if active)
+    # the list can be long, so write it out at once
+    if names:
+        print('\n'.join(names))
 
 
 def print_checkers(checkers):
     """ Print verbose checker help to stdout. """
 
-    print('')
-    print('available checkers:')
-    print('')
+    lines = ['', 'available checkers:', '']
     for name in sorted(checkers.keys()):
         description, active = checkers[name]
         prefix = '+' if active else ' '
         if len(name) > 30:
-            print(' {0} {1}'.format(prefix, name))
-            print(' ' * 35 + description)
+            lines.append(' {0} {1}'.format(prefix, name))
+            lines.append(' ' * 35 + description)
         else:
-            print(' {0} {1: <30}  {2}'.format(prefix, name, description))
-    print('')
-    print('NOTE: "+" indicates that an analysis is enabled by default.')
-    print('')
+            lines.append(' {0} {1: <30}  {2}'.format(prefix, name,
+                                                     description))
+    lines.extend(['',
+                  'NOTE: "+" indicates that an analysis is enabled by default.',
+                  ''])
+    # the list can be long, so write it out at once
+    print('\n'.join(lines))
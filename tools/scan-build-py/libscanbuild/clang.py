@@ -18,16 +18,24 @@ __all__ = ['get_version', 'get_arguments', 'get_checkers', 'is_ctu_capable',
 # regex for activated checker
 ACTIVE_CHECKER_PATTERN = re.compile(r'^-analyzer-checker=(.*)$')
 
+# version strings already queried, keyed by the compiler executable
+_VERSION_CACHE = {}
+
 
 def get_version(clang):
     """ Returns the compiler version as string.
 
+    The result is cached per compiler, because the failure report calls this
+    for every failed analysis and the version does not change in the meantime.
+
     :param clang:   the compiler we are using
     :return:        the version string printed to stderr """
 
-    output = run_command([clang, '-v'])
-    # the relevant version info is in the first line
-    return output[0]
+    if clang not in _VERSION_CACHE:
+        output = run_command([clang, '-v'])
+        # the relevant version info is in the first line
+        _VERSION_CACHE[clang] = output[0]
+    return _VERSION_CACHE[clang]
 
 
 def get_arguments(command, cwd):
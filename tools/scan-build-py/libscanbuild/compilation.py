@@ -47,6 +47,15 @@ IGNORED_FLAGS = {
     '-Xlinker': 1
 }
 
+# Compiler options which mean the compilation pass is not involved.
+NON_COMPILATION_FLAGS = frozenset(['-E', '-S', '-cc1', '-M', '-MM', '-###'])
+
+# Compiler options which take a value that might look like a filename.
+FILE_LIKE_VALUE_FLAGS = frozenset(['-D', '-I'])
+
+# Linker options with a joined value, ignored as the IGNORED_FLAGS are.
+LINKER_FLAG_PATTERN = re.compile(r'^-(l|L|Wl,).+')
+
 # Known C/C++ compiler executable name patterns
 COMPILER_PATTERNS = frozenset([
     re.compile(r'^(intercept-|analyze-|)c(c|\+\+)$'),
@@ -55,6 +64,45 @@ COMPILER_PATTERNS = frozenset([
     re.compile(r'^llvm-g(cc|\+\+)$'),
 ])
 
+# C++ compiler executable name pattern, for the names which matched one of the
+# patterns above
+CXX_COMPILER_PATTERN = re.compile(r'^(.+)(\+\+)(-.+|)$')
+
+# The results of `compiler_language`, keyed by the executable
+_COMPILER_LANGUAGES = {}
+
+# Source file extension to language map for C compiler calls. `classify_source`
+# is called for every argument of every command, so the maps are built once.
+C_SOURCE_LANGUAGES = {
+    '.c': 'c',
+    '.i': 'c-cpp-output',
+    '.ii': 'c++-cpp-output',
+    '.m': 'objective-c',
+    '.mi': 'objective-c-cpp-output',
+    '.mm': 'objective-c++',
+    '.mii': 'objective-c++-cpp-output',
+    '.C': 'c++',
+    '.cc': 'c++',
+    '.CC': 'c++',
+    '.cp': 'c++',
+    '.cpp': 'c++',
+    '.cxx': 'c++',
+    '.c++': 'c++',
+    '.C++': 'c++',
+    '.txx': 'c++'
+}
+
+# C++ compiler calls treat '.c' and '.i' files as C++.
+CXX_SOURCE_LANGUAGES = dict(C_SOURCE_LANGUAGES, **{
+    '.c': 'c++',
+    '.i': 'c++-cpp-output'
+})
+
+
+# The result of `split_command`, created once instead of on every call.
+Compilation = collections.namedtuple('Compilation',
+                                     ['compiler', 'flags', 'files'])
+
 
 def split_command(command):
     """ Returns a value when the command is a compilation, None otherwise.
@@ -65,65 +113,48 @@ def split_command(command):
         flags:    list of compile options
         compiler: string value of 'c' or 'c++' """
 
-    # the result of this method
-    result = collections.namedtuple('Compilation',
-                                    ['compiler', 'flags', 'files'])
-    result.compiler = compiler_language(command)
-    result.flags = []
-    result.files = []
+    compiler = compiler_language(command)
     # quit right now, if the program was not a C/C++ compiler
-    if not result.compiler:
+    if not compiler:
         return None
+    flags = []
+    files = []
     # iterate on the compile options
     args = iter(command[1:])
     for arg in args:
         # quit when compilation pass is not involved
-        if arg in {'-E', '-S', '-cc1', '-M', '-MM', '-###'}:
+        if arg in NON_COMPILATION_FLAGS:
             return None
         # ignore some flags
         elif arg in IGNORED_FLAGS:
-            count = IGNORED_FLAGS[arg]
-            for _ in range(count):
+            for _ in range(IGNORED_FLAGS[arg]):
                 next(args)
-        elif re.match(r'^-(l|L|Wl,).+', arg):
+        elif LINKER_FLAG_PATTERN.match(arg):
             pass
         # some parameters could look like filename, take as compile option
-        elif arg in {'-D', '-I'}:
-            result.flags.extend([arg, next(args)])
+        elif arg in FILE_LIKE_VALUE_FLAGS:
+            flags.extend([arg, next(args)])
         # parameter which looks source file is taken...
-        elif re.match(r'^[^-].+', arg) and classify_source(arg):
-            result.files.append(arg)
+        elif not arg.startswith('-') and classify_source(arg):
+            files.append(arg)
         # and consider everything else as compile option.
         else:
-            result.flags.append(arg)
+            flags.append(arg)
     # do extra check on number of source files
-    return result if result.files else None
+    return Compilation(compiler, flags, files) if files else None
 
 
 def classify_source(filename, c_compiler=True):
     """ Return the language from file name extension. """
 
-    mapping = {
-        '.c': 'c' if c_compiler else 'c++',
-        '.i': 'c-cpp-output' if c_compiler else 'c++-cpp-output',
-        '.ii': 'c++-cpp-output',
-        '.m': 'objective-c',
-        '.mi': 'objective-c-cpp-output',
-        '.mm': 'objective-c++',
-        '.mii': 'objective-c++-cpp-output',
-        '.C': 'c++',
-        '.cc': 'c++',
-        '.CC': 'c++',
-        '.cp': 'c++',
-        '.cpp': 'c++',
-        '.cxx': 'c++',
-        '.c++': 'c++',
-        '.C++': 'c++',
-        '.txx': 'c++'
-    }
-
-    __, extension = os.path.splitext(os.path.basename(filename))
-    return mapping.get(extension)
+    mapping = C_SOURCE_LANGUAGES if c_compiler else CXX_SOURCE_LANGUAGES
+
+    basename = os.path.basename(filename)
+    dot = basename.rfind('.')
+    # same as `os.path.splitext`: leading dots do not start an extension
+    if dot > 0 and basename[:dot].lstrip('.'):
+        return mapping.get(basename[dot:])
+    return None
 
 
 def compiler_language(command):
@@ -131,10 +162,21 @@ def compiler_language(command):
 
     Returns 'c' or 'c++' when it match. None otherwise. """
 
-    cplusplus = re.compile(r'^(.+)(\+\+)(-.+|)$')
-
     if command:
-        executable = os.path.basename(command[0])
-        if any(pattern.match(executable) for pattern in COMPILER_PATTERNS):
-            return 'c++' if cplusplus.match(executable) else 'c'
+        executable = command[0]
+        # builds call the same few compilers over and over, so the decision
+        # is made once per executable
+        if executable not in _COMPILER_LANGUAGES:
+            _COMPILER_LANGUAGES[executable] = executable_language(executable)
+        return _COMPILER_LANGUAGES[executable]
+    return None
+
+
+def executable_language(executable):
+    """ Returns 'c' or 'c++' when the executable name match a compiler name.
+    None otherwise. """
+
+    name = os.path.basename(executable)
+    if any(pattern.match(name) for pattern in COMPILER_PATTERNS):
+        return 'c++' if CXX_COMPILER_PATTERN.match(name) else 'c'
     return None
@@ -27,6 +27,7 @@ import itertools
 import json
 import glob
 import logging
+from multiprocessing.pool import ThreadPool
 from libear import build_libear, TemporaryDirectory
 from libscanbuild import command_entry_point, compiler_wrapper, \
     wrapper_environment, run_command, run_build
@@ -79,9 +80,12 @@ def capture(args):
             previous = iter([])
         # filter out duplicate entries from both
         duplicate = duplicate_check(entry_hash)
-        return (entry
-                for entry in itertools.chain(previous, current)
-                if os.path.exists(entry['file']) and not duplicate(entry))
+        entries = [entry
+                   for entry in itertools.chain(previous, current)
+                   if not duplicate(entry)]
+        # filter out entries which source file does not exist (anymore)
+        exists = existing_files(entry['file'] for entry in entries)
+        return (entry for entry in entries if entry['file'] in exists)
 
     with TemporaryDirectory(prefix='intercept-') as tmp_dir:
         # run the build command
@@ -223,6 +227,29 @@ def format_entry(exec_trace):
             }
 
 
+def existing_files(filenames, workers=8):
+    """ Check the existence of the given files concurrently.
+
+    On network file systems each stat call has a high latency, which would
+    make checking thousands of source files one by one slow.
+
+    :param filenames: iterable of file names (duplicates are allowed),
+    :param workers: number of threads to run the checks on,
+    :return: a set of those file names which exist. """
+
+    unique = list(set(filenames))
+    if len(unique) <= 1:
+        return set(name for name in unique if os.path.exists(name))
+
+    pool = ThreadPool(min(workers, len(unique)))
+    try:
+        found = pool.map(os.path.exists, unique)
+    finally:
+        pool.close()
+        pool.join()
+    return set(name for name, exists in zip(unique, found) if exists)
+
+
 def is_preload_disabled(platform):
     """ Library-based interposition will fail silently if SIP is enabled,
     so this should be detected. You can detect whether SIP is enabled on
@@ -298,18 +298,23 @@ def parse_bug_plist(filename):
         }
 
 
+# Patterns of the bug information comments in the HTML report header.
+BUG_HTML_PATTERNS = [
+    re.compile(r'<!-- BUGTYPE (?P<bug_type>.*) -->$'),
+    re.compile(r'<!-- BUGFILE (?P<bug_file>.*) -->$'),
+    re.compile(r'<!-- BUGPATHLENGTH (?P<bug_path_length>.*) -->$'),
+    re.compile(r'<!-- BUGLINE (?P<bug_line>.*) -->$'),
+    re.compile(r'<!-- BUGCATEGORY (?P<bug_category>.*) -->$'),
+    re.compile(r'<!-- BUGDESC (?P<bug_description>.*) -->$'),
+    re.compile(r'<!-- FUNCTIONNAME (?P<bug_function>.*) -->$')
+]
+# The bug information ends at this comment.
+BUG_HTML_END_PATTERN = re.compile(r'<!-- BUGMETAEND -->')
+
+
 def parse_bug_html(filename):
     """ Parse out the bug information from HTML output. """
 
-    patterns = [re.compile(r'<!-- BUGTYPE (?P<bug_type>.*) -->$'),
-                re.compile(r'<!-- BUGFILE (?P<bug_file>.*) -->$'),
-                re.compile(r'<!-- BUGPATHLENGTH (?P<bug_path_length>.*) -->$'),
-                re.compile(r'<!-- BUGLINE (?P<bug_line>.*) -->$'),
-                re.compile(r'<!-- BUGCATEGORY (?P<bug_category>.*) -->$'),
-                re.compile(r'<!-- BUGDESC (?P<bug_description>.*) -->$'),
-                re.compile(r'<!-- FUNCTIONNAME (?P<bug_function>.*) -->$')]
-    endsign = re.compile(r'<!-- BUGMETAEND -->')
-
     bug = {
         'report_file': filename,
         'bug_function': 'n/a',  # compatibility with < clang-3.5
@@ -319,13 +324,14 @@ def parse_bug_html(filename):
     }
 
     with open(filename) as handler:
-        for line in handler.readlines():
+        for line in handler:
             # do not read the file further
-            if endsign.match(line):
+            if BUG_HTML_END_PATTERN.match(line):
                 break
             # search for the right lines
-            for regex in patterns:
-                match = regex.match(line.strip())
+            line = line.strip()
+            for regex in BUG_HTML_PATTERNS:
+                match = regex.match(line)
                 if match:
                     bug.update(match.groupdict())
                     break
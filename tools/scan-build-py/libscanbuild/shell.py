@@ -9,6 +9,16 @@ import shlex
 
 __all__ = ['encode', 'decode']
 
+# characters which needs the argument to be protected by quotes
+RESERVED = frozenset({' ', '$', '%', '&', '(', ')', '[', ']', '{', '}', '*',
+                      '|', '<', '>', '@', '?', '!'})
+# characters which can follow the escaping backslash
+ESCAPABLE = RESERVED | {'\\'}
+# characters which needs to be escaped inside the argument
+ESCAPE_TABLE = {'\\': '\\\\', '"': '\\"'}
+# arguments without any of these characters are encoded as they are
+SPECIAL = RESERVED | {'\\', '"', "'"}
+
 
 def encode(command):
     """ Takes a command as list and returns a string. """
@@ -20,15 +30,13 @@ def encode(command):
         for this job. Currently is running through the string with a basic
         state checking. """
 
-        reserved = {' ', '$', '%', '&', '(', ')', '[', ']', '{', '}', '*', '|',
-                    '<', '>', '@', '?', '!'}
         state = 0
         for current in word:
-            if state == 0 and current in reserved:
+            if state == 0 and current in RESERVED:
                 return True
             elif state == 0 and current == '\\':
                 state = 1
-            elif state == 1 and current in reserved | {'\\'}:
+            elif state == 1 and current in ESCAPABLE:
                 state = 0
             elif state == 0 and current == '"':
                 state = 2
@@ -43,8 +51,11 @@ def encode(command):
     def escape(word):
         """ Do protect argument if that's needed. """
 
-        table = {'\\': '\\\\', '"': '\\"'}
-        escaped = ''.join([table.get(c, c) for c in word])
+        # most of the arguments are plain words, leave those untouched
+        if SPECIAL.isdisjoint(word):
+            return word
+
+        escaped = ''.join([ESCAPE_TABLE.get(c, c) for c in word])
 
         return '"' + escaped + '"' if needs_quote(word) else escaped
 
@@ -112,6 +112,9 @@ class SourceClassifierTest(unittest.TestCase):
         self.assertIsNone(sut.classify_source('file.exe'))
         self.assertIsNone(sut.classify_source('/path/file.o'))
         self.assertIsNone(sut.classify_source('clang'))
+        self.assertIsNone(sut.classify_source('.c'))
+        self.assertIsNone(sut.classify_source('/path/..c'))
+        self.assertIsNone(sut.classify_source('/path.c/file'))
 
         self.assertEqual('c', sut.classify_source('file.c'))
         self.assertEqual('c', sut.classify_source('./file.c'))
@@ -119,3 +122,5 @@ class SourceClassifierTest(unittest.TestCase):
         self.assertEqual('c++', sut.classify_source('file.c', False))
         self.assertEqual('c++', sut.classify_source('./file.c', False))
         self.assertEqual('c++', sut.classify_source('/path/file.c', False))
+        self.assertEqual('c++', sut.classify_source('/path/.file.cpp'))
+        self.assertEqual('c++-cpp-output', sut.classify_source('file.i', False))
@@ -35,6 +35,21 @@ class InterceptUtilTest(unittest.TestCase):
         self.assertEqual(os.path.join(current, 'file.c'),
                          test(os.path.join(current, 'file.c')))
 
+    def test_existing_files(self):
+        with libear.TemporaryDirectory() as tmpdir:
+            present = [os.path.join(tmpdir, 'file{0}.c'.format(i))
+                       for i in range(20)]
+            for filename in present:
+                open(filename, 'w').close()
+            missing = [os.path.join(tmpdir, 'missing.c')]
+
+            self.assertEqual(set(), sut.existing_files([]))
+            self.assertEqual(set(), sut.existing_files(missing))
+            self.assertEqual(set(present[:1]),
+                             sut.existing_files(present[:1] + present[:1]))
+            self.assertEqual(set(present),
+                             sut.existing_files(present + missing + present))
+
     def test_sip(self):
         def create_status_report(filename, message):
             content = """#!/usr/bin/env sh
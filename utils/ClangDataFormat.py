@@ -35,26 +35,41 @@ def QualType_summary(qualty, internal_dict):
 def StringRef_summary(strref, internal_dict):
 	return StringRef(strref).summary()
 
+# clang::SourceLocation keeps the macro flag in the top bit of its ID and the
+# offset in the remaining bits.
+MacroIDBit = 1 << 31
+
 class SourceLocation(object):
 	def __init__(self, srcloc):
 		self.srcloc = srcloc
 		self.ID = srcloc.GetChildAtIndex(0).GetValueAsUnsigned()
 		self.frame = srcloc.GetFrame()
+		self.path = None
 	
+	def getPath(self):
+		if self.path is None:
+			self.path = getExpressionPath(self.srcloc)
+		return self.path
+
 	def offset(self):
-		return getValueFromExpression(self.srcloc, ".getOffset()").GetValueAsUnsigned()
+		return self.ID & ~MacroIDBit
 
 	def isInvalid(self):
 		return self.ID == 0
 
 	def isMacro(self):
-		return getValueFromExpression(self.srcloc, ".isMacroID()").GetValueAsUnsigned()
+		return (self.ID & MacroIDBit) != 0
 
 	def isLocal(self, srcmgr_path):
-		return self.frame.EvaluateExpression("(%s).isLocalSourceLocation(%s)" % (srcmgr_path, getExpressionPath(self.srcloc))).GetValueAsUnsigned()
+		# Mirror SourceManager::isLocalSourceLocation by reading NextLocalOffset
+		# directly, which does not need to run code in the inferior.
+		next_local_offset = self.frame.GetValueForVariablePath(srcmgr_path + ".NextLocalOffset")
+		if next_local_offset.IsValid():
+			return self.offset() < next_local_offset.GetValueAsUnsigned()
+		return self.frame.EvaluateExpression("(%s).isLocalSourceLocation(%s)" % (srcmgr_path, self.getPath())).GetValueAsUnsigned()
 
 	def getPrint(self, srcmgr_path):
-		print_str = getValueFromExpression(self.srcloc, ".printToString(%s)" % srcmgr_path)
+		print_str = self.frame.EvaluateExpression(self.getPath() + ".printToString(%s)" % srcmgr_path)
 		return print_str.GetSummary()
 
 	def summary(self):
@@ -96,13 +111,15 @@ class StringRef(object):
 		return '"%s"' % string
 
 
-# Key is a (function address, type name) tuple, value is the expression path for
-# an object with such a type name from inside that function.
+# Key is a (module UUID, function address, type name) tuple, value is the
+# expression path for an object with such a type name from inside that function.
+# Function addresses are file addresses, so they are only unique per module.
 FramePathMapCache = {}
 
 def findObjectExpressionPath(typename, frame):
+	module_uuid = frame.GetModule().GetUUIDString()
 	func_addr = frame.GetFunction().GetStartAddress().GetFileAddress()
-	key = (func_addr, typename)
+	key = (module_uuid, func_addr, typename)
 	try:
 		return FramePathMapCache[key]
 	except KeyError:
@@ -115,35 +132,36 @@ def findObjectExpressionPath(typename, frame):
 		return path
 
 def findObject(typename, frame):
-	def getTypename(value):
-		# FIXME: lldb should provide something like getBaseType
-		ty = value.GetType()
-		if ty.IsPointerType() or ty.IsReferenceType():
-			return ty.GetPointeeType().GetName()
-		return ty.GetName()
-
 	def searchForType(value, searched):
-		tyname = getTypename(value)
-		#print "SEARCH:", getExpressionPath(value), value.GetType().GetName()
-		if tyname == typename:
-			return value
-		ty = value.GetType()
-		if not (ty.IsPointerType() or
-		        ty.IsReferenceType() or
+		# Depth-first, in the same order as a recursive search, but with an
+		# explicit stack of (parent, next child index, number of children) so
+		# that each child is only fetched from lldb once it is reached.
+		stack = []
+		while value is not None:
+			ty = value.GetType()
+			# FIXME: lldb should provide something like getBaseType
+			is_indirect = ty.IsPointerType() or ty.IsReferenceType()
+			tyname = ty.GetPointeeType().GetName() if is_indirect else ty.GetName()
+			#print "SEARCH:", getExpressionPath(value), ty.GetName()
+			if tyname == typename:
+				return value
+			# FIXME: Hashing for SBTypes does not seem to work correctly, uses the typename instead,
+			# and not the canonical one unfortunately.
+			if ((is_indirect or
 				# FIXME: lldb should provide something like getCanonicalType
-		        tyname.startswith("llvm::IntrusiveRefCntPtr<") or
-		        tyname.startswith("llvm::OwningPtr<")):
-			return None
-		# FIXME: Hashing for SBTypes does not seem to work correctly, uses the typename instead,
-		# and not the canonical one unfortunately.
-		if tyname in searched:
-			return None
-		searched.add(tyname)
-		for i in range(value.GetNumChildren()):
-			child = value.GetChildAtIndex(i, 0, False)
-			found = searchForType(child, searched)
-			if found:
-				return found
+			     tyname.startswith("llvm::IntrusiveRefCntPtr<") or
+			     tyname.startswith("llvm::OwningPtr<")) and
+			    tyname not in searched):
+				searched.add(tyname)
+				stack.append((value, 0, value.GetNumChildren()))
+			value = None
+			while stack:
+				parent, i, num_children = stack.pop()
+				if i < num_children:
+					stack.append((parent, i + 1, num_children))
+					value = parent.GetChildAtIndex(i, 0, False)
+					break
+		return None
 
 	searched = set()
 	value_list = frame.GetVariables(True, True, True, True)
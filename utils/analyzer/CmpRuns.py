@@ -225,11 +225,13 @@ def loadResultsFromSingleRun(info, deleteEmpty=True):
         run.readSingleFile(path, deleteEmpty)
     else:
         for (dirpath, dirnames, filenames) in os.walk(path):
+            # Join the directory once; os.path.join only adds a separator if
+            # needed.
+            prefix = os.path.join(dirpath, '')
             for f in filenames:
                 if (not f.endswith('plist')):
                     continue
-                p = os.path.join(dirpath, f)
-                run.readSingleFile(p, deleteEmpty)
+                run.readSingleFile(prefix + f, deleteEmpty)
 
     return run
 
@@ -238,6 +240,14 @@ def cmpAnalysisDiagnostic(d):
     return d.getIssueIdentifier()
 
 
+# Histogram options and the path length difference each of them plots, in
+# order of precedence.
+PATH_DIFFERENCE_HISTOGRAMS = [
+    ('relative_path_histogram', lambda a, b: float(a) / b),
+    ('relative_log_path_histogram', lambda a, b: log(float(a) / b)),
+    ('absolute_path_histogram', lambda a, b: a - b),
+]
+
 def compareResults(A, B, opts):
     """
     compareResults - Generate a relation from diagnostics in run A to
@@ -251,6 +261,10 @@ def compareResults(A, B, opts):
 
     # Map size_before -> size_after
     path_difference_data = []
+    # Pick the recorded path length difference once, not for every pair.
+    path_difference = next((difference for option, difference
+                            in PATH_DIFFERENCE_HISTOGRAMS
+                            if getattr(opts, option)), None)
 
     # Quickly eliminate equal elements.
     neqA = []
@@ -263,16 +277,10 @@ def compareResults(A, B, opts):
         a = eltsA.pop()
         b = eltsB.pop()
         if (a.getIssueIdentifier() == b.getIssueIdentifier()):
-            if a.getPathLength() != b.getPathLength():
-                if opts.relative_path_histogram:
-                    path_difference_data.append(
-                        float(a.getPathLength()) / b.getPathLength())
-                elif opts.relative_log_path_histogram:
-                    path_difference_data.append(
-                        log(float(a.getPathLength()) / b.getPathLength()))
-                elif opts.absolute_path_histogram:
-                    path_difference_data.append(
-                        a.getPathLength() - b.getPathLength())
+            if path_difference is not None and \
+                    a.getPathLength() != b.getPathLength():
+                path_difference_data.append(
+                    path_difference(a.getPathLength(), b.getPathLength()))
 
             res.append((a, b))
         elif a.getIssueIdentifier() > b.getIssueIdentifier():
@@ -290,13 +298,10 @@ def compareResults(A, B, opts):
     # the basis for matching. This has the nice property that we don't depend
     # in any way on the diagnostic format.
 
-    for a in neqA:
-        res.append((a, None))
-    for b in neqB:
-        res.append((None, b))
+    res.extend((a, None) for a in neqA)
+    res.extend((None, b) for b in neqB)
 
-    if opts.relative_log_path_histogram or opts.relative_path_histogram or \
-            opts.absolute_path_histogram:
+    if path_difference is not None:
         from matplotlib import pyplot
         pyplot.hist(path_difference_data, bins=100)
         pyplot.show()
@@ -305,32 +310,36 @@ def compareResults(A, B, opts):
 
 def computePercentile(l, percentile):
     """
-    Return computed percentile.
+    Return computed percentile of the already sorted list l.
     """
-    return sorted(l)[int(round(percentile * len(l) + 0.5)) - 1]
+    return l[int(round(percentile * len(l) + 0.5)) - 1]
 
 def deriveStats(results):
     # Assume all keys are the same in each statistics bucket.
     combined_data = defaultdict(list)
 
-    # Collect data on paths length.
-    for report in results.reports:
-        for diagnostic in report.diagnostics:
-            combined_data['PathsLength'].append(diagnostic.getPathLength())
+    # Collect data on paths length from the run's cumulative diagnostics list,
+    # rather than walking each report again.
+    paths_length = [d.getPathLength() for d in results.diagnostics]
+    if paths_length:
+        combined_data['PathsLength'] = paths_length
 
     for stat in results.stats:
         for key, value in stat.items():
             combined_data[key].append(value)
     combined_stats = {}
     for key, values in combined_data.items():
+        # Sort once for all of the order statistics below.
+        values.sort()
+        total = sum(values)
         combined_stats[str(key)] = {
-            "max": max(values),
-            "min": min(values),
-            "mean": sum(values) / len(values),
+            "max": values[-1],
+            "min": values[0],
+            "mean": total / len(values),
             "90th %tile": computePercentile(values, 0.9),
             "95th %tile": computePercentile(values, 0.95),
-            "median": sorted(values)[len(values) // 2],
-            "total": sum(values)
+            "median": values[len(values) // 2],
+            "total": total
         }
     return combined_stats
 
@@ -378,19 +387,19 @@ def dumpScanBuildResultsDiff(dirA, dirB, opts, deleteEmpty=True,
     for res in diff:
         a, b = res
         if a is None:
-            Stdout.write("ADDED: %r\n" % b.getReadableName())
+            name = b.getReadableName()
+            Stdout.write("ADDED: %r\n" % name)
             foundDiffs += 1
             totalAdded += 1
             if auxLog:
-                auxLog.write("('ADDED', %r, %r)\n" % (b.getReadableName(),
-                                                      b.getReport()))
+                auxLog.write("('ADDED', %r, %r)\n" % (name, b.getReport()))
         elif b is None:
-            Stdout.write("REMOVED: %r\n" % a.getReadableName())
+            name = a.getReadableName()
+            Stdout.write("REMOVED: %r\n" % name)
             foundDiffs += 1
             totalRemoved += 1
             if auxLog:
-                auxLog.write("('REMOVED', %r, %r)\n" % (a.getReadableName(),
-                                                        a.getReport()))
+                auxLog.write("('REMOVED', %r, %r)\n" % (name, a.getReport()))
         else:
             pass
 
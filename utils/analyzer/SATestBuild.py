@@ -62,6 +62,10 @@ try:
     import queue
 except ImportError:
     import Queue as queue
+try:
+    from logging.handlers import QueueHandler, QueueListener
+except ImportError:
+    QueueHandler = QueueListener = None
 
 ###############################################################################
 # Helper functions.
@@ -81,7 +85,11 @@ class StreamToLogger(object):
 
     def write(self, buf):
         # Rstrip in order not to write an extra newline.
-        self.logger.log(self.log_level, buf.rstrip())
+        buf = buf.rstrip()
+        # Blank writes would only produce empty records, each taking the
+        # handler lock shared by all worker threads.
+        if buf:
+            self.logger.log(self.log_level, buf)
 
     def flush(self):
         pass
@@ -90,6 +98,29 @@ class StreamToLogger(object):
         return 0
 
 
+def startLogListener():
+    """
+    Route log records through a queue to a dedicated thread, so that worker
+    threads do not contend on the console handler's lock.
+    :return: a function restoring the original handlers, or None if this
+    Python's logging module does not support it.
+    """
+    if QueueListener is None:
+        return None
+    RootLogger = logging.getLogger()
+    Handlers = RootLogger.handlers[:]
+    # Unbounded, as QueueHandler drops records it cannot put without waiting.
+    LogQueue = queue.Queue()
+    Listener = QueueListener(LogQueue, *Handlers)
+    RootLogger.handlers = [QueueHandler(LogQueue)]
+    Listener.start()
+
+    def stopLogListener():
+        Listener.stop()
+        RootLogger.handlers = Handlers
+    return stopLogListener
+
+
 def getProjectMapPath():
     ProjectMapPath = os.path.join(os.path.abspath(os.curdir),
                                   ProjectMapFile)
@@ -616,42 +647,46 @@ def cleanupReferenceResults(SBOutputDir):
     Delete html, css, and js files from reference results. These can
     include multiple copies of the benchmark source and so get very large.
     """
-    Extensions = ["html", "css", "js"]
-    for E in Extensions:
-        for F in glob.glob("%s/*/*.%s" % (SBOutputDir, E)):
-            P = os.path.join(SBOutputDir, F)
-            RmCommand = "rm '%s'" % P
-            check_call(RmCommand, shell=True)
+    Extensions = (".html", ".css", ".js")
+    # List the result directories once and filter by suffix, rather than
+    # globbing them again for every extension.
+    for F in glob.glob(SBOutputDir + "/*/*"):
+        if not F.endswith(Extensions):
+            continue
+        os.remove(os.path.join(SBOutputDir, F))
 
     # Remove the log file. It leaks absolute path names.
     removeLogFile(SBOutputDir)
 
 
 class TestProjectThread(threading.Thread):
-    def __init__(self, Args, TasksQueue, ResultsDiffer, FailureFlag):
+    def __init__(self, Args, TasksQueue, FailureFlag):
         """
-        :param ResultsDiffer: Used to signify that results differ from
-        the canonical ones.
         :param FailureFlag: Used to signify a failure during the run.
         """
         self.Args = Args
         self.TasksQueue = TasksQueue
-        self.ResultsDiffer = ResultsDiffer
         self.FailureFlag = FailureFlag
+        # Set when results of a project tested by this thread differ from
+        # the canonical ones. Only read once the thread has been joined.
+        self.ResultsDiffer = False
         super(TestProjectThread, self).__init__()
 
         # Needed to gracefully handle interrupts with Ctrl-C
         self.daemon = True
 
     def run(self):
-        while not self.TasksQueue.empty():
+        while True:
+            try:
+                ProjArgs = self.TasksQueue.get_nowait()
+            except queue.Empty:
+                return
             try:
-                ProjArgs = self.TasksQueue.get()
                 Logger = logging.getLogger(ProjArgs[0])
                 Local.stdout = StreamToLogger(Logger, logging.INFO)
                 Local.stderr = StreamToLogger(Logger, logging.ERROR)
-                if not testProject(Args, *ProjArgs):
-                    self.ResultsDiffer.set()
+                if not testProject(self.Args, *ProjArgs):
+                    self.ResultsDiffer = True
                 self.TasksQueue.task_done()
             except:
                 self.FailureFlag.set()
@@ -744,20 +779,33 @@ def multiThreadedTestAll(Args, ProjectsToTest, Jobs):
     for ProjArgs in ProjectsToTest:
         TasksQueue.put(ProjArgs)
 
-    ResultsDiffer = threading.Event()
     FailureFlag = threading.Event()
 
-    for i in range(Jobs):
-        T = TestProjectThread(Args, TasksQueue, ResultsDiffer, FailureFlag)
-        T.start()
-
-    # Required to handle Ctrl-C gracefully.
-    while TasksQueue.unfinished_tasks:
-        time.sleep(0.1)  # Seconds.
-        if FailureFlag.is_set():
-            Local.stderr.write("Test runner crashed\n")
-            sys.exit(1)
-    return not ResultsDiffer.is_set()
+    StopLogListener = startLogListener()
+    try:
+        Threads = []
+        for i in range(Jobs):
+            T = TestProjectThread(Args, TasksQueue, FailureFlag)
+            T.start()
+            Threads.append(T)
+
+        # Join with a timeout, as a plain join() would block Ctrl-C. This
+        # returns as soon as the last worker is done instead of on the next
+        # poll. The flag is checked once more after the join, as a worker may
+        # have crashed and exited before it was polled.
+        for T in Threads:
+            while T.is_alive() and not FailureFlag.is_set():
+                T.join(0.1)  # Seconds.
+            if FailureFlag.is_set():
+                Local.stderr.write("Test runner crashed\n")
+                sys.exit(1)
+    finally:
+        # Flush the records still queued before returning or exiting.
+        if StopLogListener:
+            StopLogListener()
+    # A crashed worker never records differing results, so it must not be
+    # counted as a pass.
+    return not (FailureFlag.is_set() or any(T.ResultsDiffer for T in Threads))
 
 
 def testAll(Args):
@@ -42,9 +42,12 @@ def hasNoExtension(FileName):
     return (Ext == "")
 
 
+# Extensions of the files accepted as single-file projects.
+SingleInputFileExtensions = frozenset([".i", ".ii", ".c", ".cpp", ".m", ""])
+
 def isValidSingleInputFile(FileName):
     (Root, Ext) = os.path.splitext(FileName)
-    return Ext in (".i", ".ii", ".c", ".cpp", ".m", "")
+    return Ext in SingleInputFileExtensions
 
 
 def runScript(ScriptPath, PBuildLogFile, Cwd, Stdout=sys.stdout,
@@ -49,7 +49,7 @@ class GenericMap(object):
 class SourceLocation(object):
     def __init__(self, json_loc):
         super(SourceLocation, self).__init__()
-        logging.debug('json: %s' % json_loc)
+        logging.debug('json: %s', json_loc)
         self.line = json_loc['line']
         self.col = json_loc['column']
         self.filename = os.path.basename(json_loc['file']) \
@@ -271,7 +271,7 @@ class CheckerMessages(object):
 class ProgramState(object):
     def __init__(self, state_id, json_ps):
         super(ProgramState, self).__init__()
-        logging.debug('Adding ProgramState ' + str(state_id))
+        logging.debug('Adding ProgramState %s', state_id)
 
         if json_ps is None:
             json_ps = {
@@ -321,7 +321,7 @@ class ExplodedNode(object):
         self.successors = []
 
     def construct(self, node_id, json_node):
-        logging.debug('Adding ' + node_id)
+        logging.debug('Adding %s', node_id)
         self.ptr = node_id[4:]
         self.points = [ProgramPoint(p) for p in json_node['program_points']]
         self.node_id = self.points[-1].node_id
@@ -348,7 +348,9 @@ class ExplodedGraph(object):
         super(ExplodedGraph, self).__init__()
         self.nodes = collections.defaultdict(ExplodedNode)
         self.root_id = None
-        self.incomplete_line = ''
+        # Pieces of a line broken across several raw lines, joined once the
+        # terminating ';' arrives rather than concatenated piece by piece.
+        self.incomplete_line = []
 
     def add_raw_line(self, raw_line):
         if raw_line.startswith('//'):
@@ -357,14 +359,16 @@ class ExplodedGraph(object):
         # Allow line breaks by waiting for ';'. This is not valid in
         # a .dot file, but it is useful for writing tests.
         if len(raw_line) > 0 and raw_line[-1] != ';':
-            self.incomplete_line += raw_line
+            self.incomplete_line.append(raw_line)
             return
-        raw_line = self.incomplete_line + raw_line
-        self.incomplete_line = ''
+        if self.incomplete_line:
+            self.incomplete_line.append(raw_line)
+            raw_line = ''.join(self.incomplete_line)
+            self.incomplete_line = []
 
         # Apply regexps one by one to see if it's a node or an edge
         # and extract contents if necessary.
-        logging.debug('Line: ' + raw_line)
+        logging.debug('Line: %s', raw_line)
         result = self.edge_re.match(raw_line)
         if result is not None:
             logging.debug('Classified as edge line.')
@@ -418,26 +422,31 @@ class DotDumpVisitor(object):
         self._output = []
 
     def _dump_raw(self, s):
-        if self._dump_dot_only:
-            print(s, end='')
-        else:
-            self._output.append(s)
+        # Even when dumping to stdout, collect the fragments and print them
+        # all at once at the end of the graph rather than one at a time.
+        self._output.append(s)
 
     def output(self):
-        assert not self._dump_dot_only
         return ''.join(self._output)
 
+    # Escapes applied by _dump(). None of the replacements produces another
+    # match, so they are all done in a single pass over the string.
+    _escapes = {
+        '&': '&amp;',
+        '{': '\\{',
+        '}': '\\}',
+        '\\<': '&lt;',
+        '\\>': '&gt;',
+        '\\l': '<br />',
+        '|': '\\|',
+    }
+    _escape_re = re.compile(r'&|\{|\}|\\<|\\>|\\l|\|')
+    _font_re = re.compile(r'<font color="[a-z0-9]*">|</font>')
+
     def _dump(self, s):
-        s = s.replace('&', '&amp;') \
-             .replace('{', '\\{') \
-             .replace('}', '\\}') \
-             .replace('\\<', '&lt;') \
-             .replace('\\>', '&gt;') \
-             .replace('\\l', '<br />') \
-             .replace('|', '\\|')
+        s = self._escape_re.sub(lambda m: self._escapes[m.group(0)], s)
         if self._gray_mode:
-            s = re.sub(r'<font color="[a-z0-9]*">', '', s)
-            s = re.sub(r'</font>', '', s)
+            s = self._font_re.sub('', s)
         self._dump_raw(s)
 
     @staticmethod
@@ -486,56 +495,74 @@ class DotDumpVisitor(object):
             self._dump_raw('bgcolor="gray10";\n')
         self._dump_raw('label="";\n')
 
+    # Program point kind -> (light mode color, dark mode color).
+    _program_point_colors = {
+        'Edge': ('gold3', 'gold3'),
+        'BlockEntrance': ('gold3', 'gold3'),
+        'BlockExit': ('gold3', 'gold3'),
+        'PreStmtPurgeDeadSymbols': ('red', 'red'),
+        'PostStmtPurgeDeadSymbols': ('red', 'red'),
+        'CallEnter': ('blue', 'dodgerblue'),
+        'CallExitBegin': ('blue', 'dodgerblue'),
+        'CallExitEnd': ('blue', 'dodgerblue'),
+        'Statement': ('cyan4', 'cyan4'),
+    }
+
+    def _dump_statement_point(self, p, color):
+        # This avoids pretty-printing huge statements such as CompoundStmt.
+        # Such statements show up only at [Pre|Post]StmtPurgeDeadSymbols
+        skip_pretty = 'PurgeDeadSymbols' in p.stmt_point_kind
+        stmt_color = 'cyan3'
+        self._dump('<td align="left" width="0">%s:</td>'
+                   '<td align="left" width="0"><font color="%s">'
+                   '%s</font> </td>'
+                   '<td align="left"><i>S%s</i></td>'
+                   '<td align="left"><font color="%s">%s</font></td>'
+                   '<td align="left">%s</td></tr>'
+                   % (self._make_sloc(p.loc), color,
+                      '%s (%s)' % (p.stmt_kind, p.cast_kind)
+                      if p.cast_kind is not None else p.stmt_kind,
+                      p.stmt_id, stmt_color, p.stmt_point_kind,
+                      self._short_pretty(p.pretty)
+                      if not skip_pretty else ''))
+
+    def _dump_edge_point(self, p, color):
+        self._dump('<td width="0"></td>'
+                   '<td align="left" width="0">'
+                   '<font color="%s">%s</font></td><td align="left">'
+                   '[B%d] -\\> [B%d]</td></tr>'
+                   % (color, 'BlockEdge', p.src_id, p.dst_id))
+
+    def _dump_block_entrance_point(self, p, color):
+        self._dump('<td width="0"></td>'
+                   '<td align="left" width="0">'
+                   '<font color="%s">%s</font></td>'
+                   '<td align="left">[B%d]</td></tr>'
+                   % (color, p.kind, p.block_id))
+
+    def _dump_other_point(self, p, color):
+        # TODO: Print more stuff for other kinds of points.
+        self._dump('<td width="0"></td>'
+                   '<td align="left" width="0" colspan="2">'
+                   '<font color="%s">%s</font></td></tr>'
+                   % (color, p.kind))
+
+    # Program point kind -> function dumping the kind specific columns.
+    _program_point_dumpers = {
+        'Statement': _dump_statement_point,
+        'Edge': _dump_edge_point,
+        'BlockEntrance': _dump_block_entrance_point,
+    }
+
     def visit_program_point(self, p):
-        if p.kind in ['Edge', 'BlockEntrance', 'BlockExit']:
-            color = 'gold3'
-        elif p.kind in ['PreStmtPurgeDeadSymbols',
-                        'PostStmtPurgeDeadSymbols']:
-            color = 'red'
-        elif p.kind in ['CallEnter', 'CallExitBegin', 'CallExitEnd']:
-            color = 'dodgerblue' if self._dark_mode else 'blue'
-        elif p.kind in ['Statement']:
-            color = 'cyan4'
-        else:
-            color = 'forestgreen'
+        color = self._program_point_colors.get(
+            p.kind, ('forestgreen', 'forestgreen'))[self._dark_mode]
 
         self._dump('<tr><td align="left">%s.</td>' % p.node_id)
 
-        if p.kind == 'Statement':
-            # This avoids pretty-printing huge statements such as CompoundStmt.
-            # Such statements show up only at [Pre|Post]StmtPurgeDeadSymbols
-            skip_pretty = 'PurgeDeadSymbols' in p.stmt_point_kind
-            stmt_color = 'cyan3'
-            self._dump('<td align="left" width="0">%s:</td>'
-                       '<td align="left" width="0"><font color="%s">'
-                       '%s</font> </td>'
-                       '<td align="left"><i>S%s</i></td>'
-                       '<td align="left"><font color="%s">%s</font></td>'
-                       '<td align="left">%s</td></tr>'
-                       % (self._make_sloc(p.loc), color,
-                          '%s (%s)' % (p.stmt_kind, p.cast_kind)
-                          if p.cast_kind is not None else p.stmt_kind,
-                          p.stmt_id, stmt_color, p.stmt_point_kind,
-                          self._short_pretty(p.pretty)
-                          if not skip_pretty else ''))
-        elif p.kind == 'Edge':
-            self._dump('<td width="0"></td>'
-                       '<td align="left" width="0">'
-                       '<font color="%s">%s</font></td><td align="left">'
-                       '[B%d] -\\> [B%d]</td></tr>'
-                       % (color, 'BlockEdge', p.src_id, p.dst_id))
-        elif p.kind == 'BlockEntrance':
-            self._dump('<td width="0"></td>'
-                       '<td align="left" width="0">'
-                       '<font color="%s">%s</font></td>'
-                       '<td align="left">[B%d]</td></tr>'
-                       % (color, p.kind, p.block_id))
-        else:
-            # TODO: Print more stuff for other kinds of points.
-            self._dump('<td width="0"></td>'
-                       '<td align="left" width="0" colspan="2">'
-                       '<font color="%s">%s</font></td></tr>'
-                       % (color, p.kind))
+        dump_point = self._program_point_dumpers.get(
+            p.kind, DotDumpVisitor._dump_other_point)
+        dump_point(self, p, color)
 
         if p.tag is not None:
             self._dump('<tr><td width="0"></td><td width="0"></td>'
@@ -846,7 +873,9 @@ class DotDumpVisitor(object):
     def visit_end_of_graph(self):
         self._dump_raw('}\n')
 
-        if not self._dump_dot_only:
+        if self._dump_dot_only:
+            print(self.output(), end='')
+        else:
             import sys
             import tempfile
 
@@ -898,12 +927,17 @@ class BasicExplorer(object):
 
     def explore(self, graph, visitor):
         visitor.visit_begin_graph(graph)
-        for node in sorted(graph.nodes):
-            logging.debug('Visiting ' + node)
-            visitor.visit_node(graph.nodes[node])
-            for succ in sorted(graph.nodes[node].successors):
-                logging.debug('Visiting edge: %s -> %s ' % (node, succ))
-                visitor.visit_edge(graph.nodes[node], graph.nodes[succ])
+        # Bind what is looked up for every node and edge once.
+        nodes = graph.nodes
+        visit_node = visitor.visit_node
+        visit_edge = visitor.visit_edge
+        for node_id in sorted(nodes):
+            logging.debug('Visiting %s', node_id)
+            node = nodes[node_id]
+            visit_node(node)
+            for succ in sorted(node.successors):
+                logging.debug('Visiting edge: %s -> %s ', node_id, succ)
+                visit_edge(node, nodes[succ])
         visitor.visit_end_of_graph()
 
 
@@ -948,32 +982,47 @@ class TargetedTrimmer(object):
         self._target_nodes = target_nodes
 
     @staticmethod
-    def parse_target_node(node, graph):
+    def parse_target_node(node, graph, ids_by_node_id=None):
         if node.startswith('0x'):
             ret = 'Node' + node
             assert ret in graph.nodes
             return ret
         else:
-            for other_id in graph.nodes:
-                other = graph.nodes[other_id]
-                if other.node_id == int(node):
-                    return other_id
+            if ids_by_node_id is None:
+                ids_by_node_id = TargetedTrimmer.index_node_ids(graph)
+            return ids_by_node_id.get(int(node))
+
+    @staticmethod
+    def index_node_ids(graph):
+        # Maps each stable node ID to the first node reporting it, as the
+        # lookup by stable ID would find it.
+        ids_by_node_id = {}
+        for other_id in graph.nodes:
+            ids_by_node_id.setdefault(graph.nodes[other_id].node_id, other_id)
+        return ids_by_node_id
 
     @staticmethod
     def parse_target_nodes(target_nodes, graph):
-        return [TargetedTrimmer.parse_target_node(node, graph)
-                for node in target_nodes.split(',')]
+        nodes = target_nodes.split(',')
+        # Index the graph once rather than scanning it for every stable ID.
+        ids_by_node_id = None
+        if not all(node.startswith('0x') for node in nodes):
+            ids_by_node_id = TargetedTrimmer.index_node_ids(graph)
+        return [TargetedTrimmer.parse_target_node(node, graph, ids_by_node_id)
+                for node in nodes]
 
     def trim(self, graph):
-        queue = self._target_nodes
-        visited_nodes = set()
+        # Nodes are marked as visited when they are queued, so that a node
+        # reachable along many paths of the graph is expanded only once.
+        queue = list(self._target_nodes)
+        visited_nodes = set(queue)
 
         while len(queue) > 0:
             node_id = queue.pop()
-            visited_nodes.add(node_id)
             node = graph.nodes[node_id]
             for pred_id in node.predecessors:
                 if pred_id not in visited_nodes:
+                    visited_nodes.add(pred_id)
                     queue.append(pred_id)
         graph.nodes = {node_id: graph.nodes[node_id]
                        for node_id in visited_nodes}
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Test internal functions within SATestBuild.py."""
+
+import os
+import unittest
+
+# SATestBuild looks up the analyzer at import time.
+os.environ.setdefault('CC', 'clang')
+
+import SATestBuild
+
+
+class TestMultiThreadedTestAll(unittest.TestCase):
+
+    def setUp(self):
+        self.saved_test_project = SATestBuild.testProject
+        self.saved_start = SATestBuild.TestProjectThread.start
+
+    def tearDown(self):
+        SATestBuild.testProject = self.saved_test_project
+        SATestBuild.TestProjectThread.start = self.saved_start
+
+    def run_all(self, test_project, projects, jobs=2):
+        SATestBuild.testProject = test_project
+        return SATestBuild.multiThreadedTestAll(None, projects, jobs)
+
+    def test_results_differ(self):
+        def test_project(Args, ID, *ProjArgs):
+            return ID != 'b'
+
+        self.assertTrue(self.run_all(test_project, [('a', 0), ('c', 0)]))
+        self.assertFalse(
+            self.run_all(test_project, [('a', 0), ('b', 0), ('c', 0)]))
+
+    def test_crash_before_first_poll(self):
+        def test_project(Args, ID, *ProjArgs):
+            raise RuntimeError('crash in ' + ID)
+
+        # Let every worker crash and exit before the main thread polls it.
+        def start_and_wait(thread):
+            self.saved_start(thread)
+            thread.join()
+        SATestBuild.TestProjectThread.start = start_and_wait
+
+        with self.assertRaises(SystemExit) as cm:
+            self.run_all(test_project, [('a', 0), ('b', 0)])
+        self.assertEqual(cm.exception.code, 1)
+
+    def test_crash_is_not_a_pass(self):
+        # Even without the crash report and exit, a flagged failure must
+        # not count as a pass.
+        saved_exit = SATestBuild.sys.exit
+        SATestBuild.sys.exit = lambda code: None
+        try:
+            def test_project(Args, ID, *ProjArgs):
+                raise RuntimeError('crash in ' + ID)
+            self.assertFalse(self.run_all(test_project, [('a', 0)], jobs=1))
+        finally:
+            SATestBuild.sys.exit = saved_exit
+
+if __name__ == '__main__':
+    unittest.main()
@@ -49,13 +49,16 @@ To add a new check:
 
 from __future__ import absolute_import, division, print_function
 
+import atexit
 import imp
+import itertools
 import os
 import platform
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 try:
     import configparser
 except ImportError:
@@ -64,9 +67,13 @@ import io
 
 import obj_diff
 
+# The host platform does not change while the wrapper is running, so query it
+# once instead of on every compiler invocation.
+_is_windows = platform.system() == 'Windows'
+
 def is_windows():
     """Returns True if running on Windows."""
-    return platform.system() == 'Windows'
+    return _is_windows
 
 class WrapperStepException(Exception):
     """Exception type to be used when a step other than the original compile
@@ -111,9 +118,11 @@ def path_without_wrapper():
 def flip_dash_g(args):
     """Search for -g in args. If it exists then return args without. If not then
     add it."""
-    if '-g' in args:
+    # Drop any -g in the same pass that finds out whether there was one
+    without = [x for x in args if x != '-g']
+    if len(without) != len(args):
         # Return args without any -g
-        return [x for x in args if x != '-g']
+        return without
     else:
         # No -g, add one
         return args + ['-g']
@@ -148,21 +157,28 @@ def is_output_specified(args):
     """Return true is output file is specified in args."""
     return get_output_file(args) is not None
 
-def replace_output_file(args, new_name):
-    """Replaces the specified name of an output file with the specified name.
-    Assumes that the output file name is specified in the command line args."""
-    replaceidx = None
-    attached = False
-    for idx, val in enumerate(args):
+def find_output_file_index(args):
+    """Return the index of the last output file argument in args and whether it
+    is conjoined with -o, or (None, False) if not specified. Searches from the
+    end, as the last -o is the one that takes effect."""
+    for idx in range(len(args) - 1, -1, -1):
+        val = args[idx]
         if val == '-o':
-            replaceidx = idx + 1
-            attached = False
+            return idx + 1, False
         elif val.startswith('-o'):
-            replaceidx = idx
-            attached = True
+            return idx, True
+    return None, False
 
+def replace_output_file(args, new_name):
+    """Replaces the specified name of an output file with the specified name.
+    Assumes that the output file name is specified in the command line args."""
+    replaceidx, attached = find_output_file_index(args)
     if replaceidx is None:
         raise Exception
+    return replace_output_file_at(args, new_name, replaceidx, attached)
+
+def replace_output_file_at(args, new_name, replaceidx, attached):
+    """Replaces the output file name found by find_output_file_index."""
     replacement = new_name
     if attached == True:
         replacement = '-o' + new_name
@@ -176,8 +192,10 @@ def add_output_file(args, output_file):
 def set_output_file(args, output_file):
     """Set the output file within the arguments. Appends or replaces as
     appropriate."""
-    if is_output_specified(args):
-        args = replace_output_file(args, output_file)
+    # Look up the output file once and replace it in place when found
+    replaceidx, attached = find_output_file_index(args)
+    if replaceidx is not None:
+        args = replace_output_file_at(args, output_file, replaceidx, attached)
     else:
         args = add_output_file(args, output_file)
     return args
@@ -187,21 +205,18 @@ gSrcFileSuffixes = ('.c', '.cpp', '.cxx', '.c++', '.cp', '.cc')
 def get_input_file(args):
     """Return the input file string if it can be found (and there is only
     one)."""
-    inputFiles = list()
+    inputFile = None
     for arg in args:
-        testarg = arg
-        quotes = ('"', "'")
-        while testarg.endswith(quotes):
-            testarg = testarg[:-1]
-        testarg = os.path.normcase(testarg)
+        # Ignore any trailing quotes
+        testarg = os.path.normcase(arg.rstrip('"\''))
 
         # Test if it is a source file
         if testarg.endswith(gSrcFileSuffixes):
-            inputFiles.append(arg)
-    if len(inputFiles) == 1:
-        return inputFiles[0]
-    else:
-        return None
+            if inputFile is not None:
+                # No need to look further once there is a second one
+                return None
+            inputFile = arg
+    return inputFile
 
 def set_input_file(args, input_file):
     """Replaces the input file with that specified."""
@@ -214,20 +229,26 @@ def set_input_file(args, input_file):
         # Could not find input file
         assert False
 
-def is_normal_compile(args):
-    """Check if this is a normal compile which will output an object file rather
-    than a preprocess or link. args is a list of command line arguments."""
-    compile_step = '-c' in args
+# Options which mean the compile does not just output an object file
+gNotNormalCompileOptions = frozenset([
     # Bitcode cannot be disassembled in the same way
-    bitcode = '-flto' in args or '-emit-llvm' in args
+    '-flto', '-emit-llvm',
     # Version and help are queries of the compiler and override -c if specified
-    query = '--version' in args or '--help' in args
+    '--version', '--help',
     # Options to output dependency files for make
-    dependency = '-M' in args or '-MM' in args
+    '-M', '-MM'])
+
+def is_normal_compile(args):
+    """Check if this is a normal compile which will output an object file rather
+    than a preprocess or link. args is a list of command line arguments."""
+    # Index the arguments once instead of scanning them for every option.
+    options = set(args)
+    # A single test covers all the options which rule out a normal compile.
+    if '-c' not in options or not options.isdisjoint(gNotNormalCompileOptions):
+        return False
     # Check if the input is recognised as a source file (this may be too
     # strong a restriction)
-    input_is_valid = bool(get_input_file(args))
-    return compile_step and not bitcode and not query and not dependency and input_is_valid
+    return bool(get_input_file(args))
 
 def run_step(command, my_env, error_on_failure):
     """Runs a step of the compilation. Reports failure as exception."""
@@ -238,12 +259,51 @@ def run_step(command, my_env, error_on_failure):
     if p.returncode != 0:
         raise WrapperStepException(error_on_failure, stdout, stderr)
 
+def run_compile(command, my_env):
+    """Runs a compile with the wrapper's stdout and stderr and returns its exit
+    code, negative if it was killed by a signal (as with Popen.returncode)."""
+    # Need to use shell=True on Windows as Popen won't use PATH otherwise.
+    p = subprocess.Popen(command, env=my_env, shell=is_windows())
+    p.communicate()
+    return p.returncode
+
+def exec_compile(command, my_env):
+    """Replaces the wrapper process with the compile, for when nothing is left
+    to do after it. Does not return."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if is_windows():
+        # exec on Windows starts a new process and ends this one, so the
+        # caller would see the wrapper exit before the compile finished.
+        sys.exit(run_compile(command, my_env))
+    # execvpe searches the PATH of my_env, as Popen does.
+    os.execvpe(command[0], command, my_env)
+
+# All temporary files of one wrapper run go into a single private directory,
+# created on first use. Names within it only need to be unique to this run, so
+# they come from a counter rather than from a mkstemp call per file.
+_temp_dir = None
+_temp_dir_lock = threading.Lock()
+_temp_counter = itertools.count()
+
+def remove_temp_dir():
+    """Remove the temporary directory if it is empty. Files are left in place
+    (and so is the directory) when a check failed, for inspection."""
+    try:
+        os.rmdir(_temp_dir)
+    except OSError:
+        pass
+
 def get_temp_file_name(suffix):
     """Get a temporary file name with a particular suffix. Let the caller be
     responsible for deleting it."""
-    tf = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
-    tf.close()
-    return tf.name
+    global _temp_dir
+    with _temp_dir_lock:
+        if _temp_dir is None:
+            _temp_dir = tempfile.mkdtemp(prefix='check_cfc-')
+            atexit.register(remove_temp_dir)
+        index = next(_temp_counter)
+    return os.path.join(_temp_dir, '{}{}'.format(index, suffix))
 
 class WrapperCheck(object):
     """Base class for a check. Subclass this to add a check."""
@@ -309,6 +369,30 @@ class dash_s_no_change(WrapperCheck):
         # Clean up temp file if comparison okay
         os.remove(output_file_b)
 
+def run_checks(checkers, arguments, my_env):
+    """Run the checks concurrently. Each check does its own alternate compile
+    into its own temporary file, so they are independent of each other. If any
+    check fails, the exception of the first failing one (in the order given) is
+    raised once they have all finished."""
+    errors = [None] * len(checkers)
+
+    def run(index, checker):
+        try:
+            checker.perform_check(arguments, my_env)
+        except BaseException as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=run, args=(index, checker))
+               for index, checker in enumerate(checkers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for error in errors:
+        if error is not None:
+            raise error
+
 if __name__ == '__main__':
     # Create configuration defaults from list of checks
     default_config = """
@@ -351,17 +435,19 @@ if __name__ == '__main__':
     if output_file_orig is None:
         output_file_orig = derive_output_file(arguments_a)
 
-    p = subprocess.Popen(arguments_a, env=my_env, shell=is_windows())
-    p.communicate()
-    if p.returncode != 0:
-        sys.exit(p.returncode)
-
-    if not is_normal_compile(arguments_a) or output_file_orig is None:
+    if (not enabled_checks or not is_normal_compile(arguments_a) or
+            output_file_orig is None):
         # Bail out here if we can't apply checks in this case.
         # Does not indicate an error.
         # Maybe not straight compilation (e.g. -S or --version or -flto)
         # or maybe > 1 input files.
-        sys.exit(0)
+        # The original compilation is all that is left, so hand the process
+        # over to it rather than waiting for it.
+        exec_compile(arguments_a, my_env)
+
+    returncode = run_compile(arguments_a, my_env)
+    if returncode != 0:
+        sys.exit(returncode)
 
     # Sometimes we generate files which have very long names which can't be
     # read/disassembled. This will exit early if we can't find the file we
@@ -376,30 +462,31 @@ if __name__ == '__main__':
     # Run checks, if they are enabled in config and if they are appropriate for
     # this command line.
     current_module = sys.modules[__name__]
-    for check_name in checks:
-        if config.getboolean('Checks', check_name):
-            class_ = getattr(current_module, check_name)
-            checker = class_(temp_output_file_orig)
-            try:
-                checker.perform_check(arguments_a, my_env)
-            except WrapperCheckException as e:
-                # Check failure
-                print("{} {}".format(get_input_file(arguments_a), e.msg), file=sys.stderr)
-
-                # Remove file to comply with build system expectations (no
-                # output file if failed)
-                os.remove(output_file_orig)
-                sys.exit(1)
-
-            except WrapperStepException as e:
-                # Compile step failure
-                print(e.msg, file=sys.stderr)
-                print("*** stdout ***", file=sys.stderr)
-                print(e.stdout, file=sys.stderr)
-                print("*** stderr ***", file=sys.stderr)
-                print(e.stderr, file=sys.stderr)
-
-                # Remove file to comply with build system expectations (no
-                # output file if failed)
-                os.remove(output_file_orig)
-                sys.exit(1)
+    checkers = [getattr(current_module, check_name)(temp_output_file_orig)
+                for check_name in enabled_checks]
+    try:
+        run_checks(checkers, arguments_a, my_env)
+    except WrapperCheckException as e:
+        # Check failure
+        print("{} {}".format(get_input_file(arguments_a), e.msg), file=sys.stderr)
+
+        # Remove file to comply with build system expectations (no
+        # output file if failed)
+        os.remove(output_file_orig)
+        sys.exit(1)
+
+    except WrapperStepException as e:
+        # Compile step failure
+        print(e.msg, file=sys.stderr)
+        print("*** stdout ***", file=sys.stderr)
+        print(e.stdout, file=sys.stderr)
+        print("*** stderr ***", file=sys.stderr)
+        print(e.stderr, file=sys.stderr)
+
+        # Remove file to comply with build system expectations (no
+        # output file if failed)
+        os.remove(output_file_orig)
+        sys.exit(1)
+
+    # Clean up temp file if all checks okay
+    os.remove(temp_output_file_orig)
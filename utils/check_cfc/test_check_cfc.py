@@ -121,6 +121,18 @@ class TestCheckCFC(unittest.TestCase):
             ['clang', '-otest.o'], 'testg.o'), ['clang', '-otestg.o'])
         with self.assertRaises(Exception):
             check_cfc.replace_output_file(['clang'], 'testg.o')
+        # The last output file takes effect
+        self.assertEqual(check_cfc.replace_output_file(
+            ['clang', '-o', 'a.o', '-ob.o'], 'testg.o'),
+            ['clang', '-o', 'a.o', '-otestg.o'])
+
+    def test_find_output_file_index(self):
+        self.assertEqual(check_cfc.find_output_file_index(
+            ['clang', '-o', 'test.o', '-c']), (2, False))
+        self.assertEqual(check_cfc.find_output_file_index(
+            ['clang', '-otest.o', '-c']), (1, True))
+        self.assertEqual(check_cfc.find_output_file_index(
+            ['clang', '-c', 'test.c']), (None, False))
 
     def test_add_output_file(self):
         self.assertEqual(check_cfc.add_output_file(
@@ -133,6 +145,10 @@ class TestCheckCFC(unittest.TestCase):
         # Test output is specified
         self.assertEqual(check_cfc.set_output_file(
             ['clang', '-o', 'test.o'], 'testb.o'), ['clang', '-o', 'testb.o'])
+        # Only the last output file is replaced
+        self.assertEqual(check_cfc.set_output_file(
+            ['clang', '-o', 'a.o', '-ob.o'], 'testb.o'),
+            ['clang', '-o', 'a.o', '-otestb.o'])
 
     def test_get_input_file(self):
         # No input file
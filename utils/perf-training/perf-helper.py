@@ -14,6 +14,7 @@ import subprocess
 import argparse
 import time
 import bisect
+import itertools
 import shlex
 import tempfile
 
@@ -22,9 +23,11 @@ test_env = { 'PATH'    : os.environ['PATH'] }
 def findFilesWithExtension(path, extension):
   filenames = []
   for root, dirs, files in os.walk(path): 
+    # Join the directory once; os.path.join only adds a separator if needed.
+    prefix = os.path.join(root, '')
     for filename in files:
       if filename.endswith(extension):
-        filenames.append(os.path.join(root, filename))
+        filenames.append(prefix + filename)
   return filenames
 
 def clean(args):
@@ -109,6 +112,10 @@ def dtrace(args):
 
   return 0
 
+# Prefixes of the informational lines in '-###' output that are not commands.
+cc_output_garbage_prefixes = ('Configured with:', 'Target:', 'Thread model:',
+                              'InstalledDir:', 'LLVM Profile Note')
+
 def get_cc1_command_for_args(cmd, env):
   # Find the cc1 command used by the compiler. To do this we execute the
   # compiler with '-###' to figure out what it wants to do.
@@ -118,11 +125,7 @@ def get_cc1_command_for_args(cmd, env):
   for ln in cc_output.split('\n'):
       # Filter out known garbage.
       if (ln == 'Using built-in specs.' or
-          ln.startswith('Configured with:') or
-          ln.startswith('Target:') or
-          ln.startswith('Thread model:') or
-          ln.startswith('InstalledDir:') or
-          ln.startswith('LLVM Profile Note') or
+          ln.startswith(cc_output_garbage_prefixes) or
           ' version ' in ln):
           continue
       cc_commands.append(ln)
@@ -169,11 +172,11 @@ def parse_dtrace_symbol_file(path, all_symbols, all_symbols_set,
     return symbol
 
   def get_symbols_with_prefix(symbol):
-    start_index = bisect.bisect_left(all_symbols, symbol)
-    for s in all_symbols[start_index:]:
-      if not s.startswith(symbol):
-        break
-      yield s
+    # Walk from the insertion point without copying the tail of the list.
+    index = bisect.bisect_left(all_symbols, symbol)
+    while index < len(all_symbols) and all_symbols[index].startswith(symbol):
+      yield all_symbols[index]
+      index += 1
 
   # Extract the list of symbols from the given file, which is assumed to be
   # the output of a dtrace run logging either probefunc or ustack(1) and
@@ -225,8 +228,10 @@ def parse_dtrace_symbol_file(path, all_symbols, all_symbols_set,
         # Otherwise, we have a symbol name which isn't present in the
         # binary. We assume it is truncated, and try to extend it.
 
-        # Get all the symbols with this prefix.
-        possible_symbols = list(get_symbols_with_prefix(symbol))
+        # Get all the symbols with this prefix, but no more than needed to
+        # tell whether there are too many of them.
+        possible_symbols = list(itertools.islice(
+          get_symbols_with_prefix(symbol), 101))
         if not possible_symbols:
           continue
 
@@ -358,15 +363,14 @@ def genOrderFile(args):
   # Load all of the input files.
   print("loading from %d data files" % len(input_files))
   missing_symbols = set()
-  timestamped_symbol_lists = [
-      list(parse_dtrace_symbol_file(path, all_symbols, all_symbols_set,
-                                    missing_symbols, opts))
-      for path in input_files]
 
-  # Reorder each symbol list.
+  # Reorder each symbol list as it is loaded, so that only one file's
+  # timestamps are held at a time.
   symbol_lists = []
-  for timestamped_symbols_list in timestamped_symbol_lists:
-    timestamped_symbols_list.sort()
+  for path in input_files:
+    timestamped_symbols_list = sorted(
+        parse_dtrace_symbol_file(path, all_symbols, all_symbols_set,
+                                 missing_symbols, opts))
     symbol_lists.append([symbol for _,symbol in timestamped_symbols_list])
 
   # Execute the desire order file generation method.